@@ -1,5 +1,5 @@
+import functools
 import logging
-import re
 from pathlib import Path
 from typing import List
 
@@ -13,6 +13,25 @@ from .sources import (
 logger = logging.getLogger(__name__)
 
 
+_PROMPT_SUFFIX = "\n</user-input>\n</agent-sop>"
+
+
+def _prompt_prefix(sop_name: str, sop_content: str) -> str:
+    """Build the part of a SOP prompt that precedes the user's input"""
+    return f"""Run this SOP:
+<agent-sop name="{sop_name}">
+<content>
+{sop_content}
+</content>
+<user-input>
+"""
+
+
+def _format_prompt(prefix: str, user_input: str = "") -> str:
+    """Render a SOP prompt from its prebuilt prefix and the user's input"""
+    return prefix + user_input + _PROMPT_SUFFIX
+
+
 def run_mcp_server(sop_sources: List[str] | None = None, sop_paths: str | None = None):
     """Run the MCP server for serving SOPs as prompts
 
@@ -28,23 +47,10 @@ def run_mcp_server(sop_sources: List[str] | None = None, sop_paths: str | None =
         if name not in registered_sops:
             registered_sops.add(name)
 
-            def make_prompt_handler(sop_name: str, sop_content: str):
-                def get_prompt(user_input: str = "") -> str:
-                    return f"""Run this SOP:
-<agent-sop name="{sop_name}">
-<content>
-{sop_content}
-</content>
-<user-input>
-{user_input}
-</user-input>
-</agent-sop>"""
-
-                return get_prompt
-
-            mcp.prompt(name=name, description=description)(
-                make_prompt_handler(name, content)
-            )
+            handler = functools.partial(_format_prompt, _prompt_prefix(name, content))
+            # FastMCP derives the argument model name from __name__
+            handler.__name__ = _format_prompt.__name__
+            mcp.prompt(name=name, description=description)(handler)
 
     # Build sources list with proper precedence order
     sops_dir = Path(__file__).parent / "sops"
@@ -1,5 +1,5 @@
 import logging
-import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List
 
@@ -10,6 +10,9 @@ from .sources import (
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of skill files written concurrently
+SKILL_WRITE_MAX_WORKERS = 8
+
 
 def generate_anthropic_skills(output_dir: str, sop_sources: List[str] | None = None, sop_paths: str | None = None):
     """Generate Anthropic skills from SOPs
@@ -33,19 +36,25 @@ def generate_anthropic_skills(output_dir: str, sop_sources: List[str] | None = N
     # Load all SOPs from sources with first-wins precedence
     all_sops = load_sops_from_sources(sources)
     
-    # Create skill files for all loaded SOPs
-    for sop in all_sops:
-        _create_skill_file(
-            output_path, sop["name"], sop["content"], sop["description"]
+    # Create skill files for all loaded SOPs concurrently; results come back in
+    # SOP order so progress is printed from this thread without interleaving
+    with ThreadPoolExecutor(max_workers=SKILL_WRITE_MAX_WORKERS) as executor:
+        skill_files = executor.map(
+            lambda sop: _create_skill_file(
+                output_path, sop["name"], sop["content"], sop["description"]
+            ),
+            all_sops,
         )
+        for skill_file in skill_files:
+            print(f"Created Anthropic skill: {skill_file}")
 
     print(f"\nAnthropic skills generated in: {output_path.absolute()}")
 
 
 def _create_skill_file(
     output_path: Path, skill_name: str, content: str, description: str
-):
-    """Create a skill file with proper frontmatter"""
+) -> Path:
+    """Create a skill file with proper frontmatter, returning its path"""
     # Create skill directory and file
     skill_dir = output_path / skill_name
     skill_dir.mkdir(parents=True, exist_ok=True)
@@ -60,5 +69,9 @@ version: "1.0"
 """
 
     skill_file = skill_dir / "SKILL.md"
-    skill_file.write_text(frontmatter + content)
-    print(f"Created Anthropic skill: {skill_file}")
+    # Write both parts separately to avoid building a concatenated copy of
+    # the SOP content; newline="\n" disables newline translation
+    with skill_file.open("w", encoding="utf-8", newline="\n") as f:
+        f.write(frontmatter)
+        f.write(content)
+    return skill_file
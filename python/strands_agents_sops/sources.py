@@ -1,19 +1,202 @@
+import asyncio
 import logging
-import re
+import os
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache, lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from queue import Empty, Full, Queue
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, TypeVar
 
 logger = logging.getLogger(__name__)
 
+_OVERVIEW_HEADING = "## Overview"
+
+# Maximum number of concurrent file reads per local directory source
+LOCAL_MAX_WORKERS = 8
+
+# Maximum number of concurrent get_object requests per S3 source
+S3_MAX_WORKERS = 16
+
+# Maximum number of parsed SOPs kept in each content-fingerprint cache
+SOP_CACHE_SIZE = 4096
+
+# Shared S3 clients keyed by (region, endpoint_url, profile) so that sources with
+# the same configuration reuse one client and its HTTP connection pool
+_CLIENT_CACHE: Dict[Tuple[Optional[str], Optional[str], Optional[str]], Any] = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+
+@cache
+def _import_boto3() -> Any:
+    """Import boto3 on first use by an S3 source
+
+    boto3 is slow to import, so it is kept out of module import to keep CLI
+    startup fast when only local sources are configured.
+
+    Raises:
+        ImportError: If boto3 is not installed
+    """
+    try:
+        import boto3
+    except ImportError:
+        logger.error("boto3 is required for S3 sources. Install with: pip install boto3")
+        raise ImportError("boto3 is required for S3 sources") from None
+
+    return boto3
+
+
+def _extract_overview(content: str) -> Optional[str]:
+    r"""Extract the "## Overview" section body as a single-line description
+
+    Equivalent to searching for ``## Overview\s*\n(.*?)(?=\n#|\Z)`` with
+    re.DOTALL, but uses str.find so the regex engine never scans the body.
+
+    Returns:
+        The description, or None if the content has no Overview section
+    """
+    i = content.find(_OVERVIEW_HEADING)
+    while i >= 0:
+        # The heading must be followed by whitespace containing a newline;
+        # the section body starts after the last newline of that run
+        j = k = i + len(_OVERVIEW_HEADING)
+        while k < len(content) and content[k].isspace():
+            k += 1
+        newline = content.rfind("\n", j, k)
+        if newline >= 0:
+            start = newline + 1
+            end = content.find("\n#", start)
+            if end < 0:
+                end = len(content)
+            return content[start:end].strip().replace("\n", " ")
+        i = content.find(_OVERVIEW_HEADING, i + 1)
+    return None
+
+
+def _parse_sop(name: str, content: str) -> Optional[Dict[str, Any]]:
+    """Build a SOP dictionary from its name and content
+
+    Returns:
+        SOP dictionary with name, content, and description, or None if the
+        content has no Overview section
+    """
+    description = _extract_overview(content)
+    if description is None:
+        return None
+
+    return {
+        "name": name,
+        "content": content,
+        "description": description,
+    }
+
+
+@lru_cache(maxsize=SOP_CACHE_SIZE)
+def _read_local_sop(path: str, mtime_ns: int, size: int) -> Optional[Dict[str, Any]]:
+    """Read and parse a local SOP file, memoized on (path, mtime, size)"""
+    # Decode bytes directly to skip the TextIOWrapper that read_text sets up;
+    # only files containing CR pay for its universal-newline translation
+    content = Path(path).read_bytes().decode("utf-8")
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+
+    return _parse_sop(Path(path).name.removesuffix(".sop.md"), content)
+
+
+def _fetch_s3_sop(client: Any, bucket: str, key: str) -> Optional[Dict[str, Any]]:
+    """Download and parse a SOP object from S3"""
+    response = client.get_object(Bucket=bucket, Key=key)
+    return _parse_sop(
+        Path(key).name.removesuffix(".sop.md"),
+        response['Body'].read().decode('utf-8'),
+    )
+
+
+@lru_cache(maxsize=SOP_CACHE_SIZE)
+def _fetch_s3_sop_cached(
+    client: Any, bucket: str, key: str, etag: str
+) -> Optional[Dict[str, Any]]:
+    """Download and parse a SOP object from S3, memoized on its ETag"""
+    return _fetch_s3_sop(client, bucket, key)
+
+
+def _run_sync(coro: Any) -> Any:
+    """Run a coroutine to completion from synchronous code
+
+    Uses asyncio.run directly, or a separate thread with its own event loop
+    when called while an event loop is already running.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+T = TypeVar("T")
+
+
+def _prefetch(items: Iterable[T]) -> Iterator[T]:
+    """Iterate items while fetching the next one in a background thread
+
+    Used to overlap S3 list_objects_v2 page requests with processing of the
+    current page. Exceptions raised by the producer are re-raised here.
+    """
+    queue: Queue = Queue(maxsize=1)
+    stop = threading.Event()
+    done = object()
+
+    def put(item: Any) -> bool:
+        while not stop.is_set():
+            try:
+                queue.put(item, timeout=0.1)
+                return True
+            except Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for item in items:
+                if not put((item, None)):
+                    return
+            put((done, None))
+        except BaseException as e:
+            put((done, e))
+
+    threading.Thread(target=produce, daemon=True).start()
+
+    try:
+        while True:
+            item, error = queue.get()
+            if error is not None:
+                raise error
+            if item is done:
+                return
+            yield item
+    finally:
+        # Let a producer blocked on a full queue notice it should stop
+        stop.set()
+        try:
+            queue.get_nowait()
+        except Empty:
+            pass
+
 
 class SOPSource(ABC):
     """Abstract base class for SOP sources"""
     
     @abstractmethod
-    def load_sops(self) -> List[Dict[str, Any]]:
+    def load_sops(self, skip_names: Optional[Set[str]] = None) -> List[Dict[str, Any]]:
         """Load SOPs from this source
         
+        Args:
+            skip_names: Names of SOPs already loaded from a higher-precedence
+                source; these are skipped without being fetched
+
         Returns:
             List of SOP dictionaries with name, content, and description
         """
@@ -31,7 +214,7 @@ class LocalDirectorySource(SOPSource):
     def __init__(self, directory_path: Path):
         self.directory_path = directory_path
     
-    def load_sops(self) -> List[Dict[str, Any]]:
+    def load_sops(self, skip_names: Optional[Set[str]] = None) -> List[Dict[str, Any]]:
         """Load SOPs from local directory"""
         if not self.directory_path.exists():
             logger.warning(f"SOP directory does not exist: {self.directory_path}")
@@ -42,11 +225,20 @@ class LocalDirectorySource(SOPSource):
             return []
 
         try:
-            sop_files = filter(
-                lambda p: p.is_file(),
-                self.directory_path.glob("*.sop.md")
-            )
-            return list(filter(None, map(self._load_single_sop, sop_files)))
+            # DirEntry.is_file() uses the type cached by readdir, so only
+            # symlinks need an extra stat call
+            with os.scandir(self.directory_path) as entries:
+                sop_files = [
+                    Path(entry.path)
+                    for entry in entries
+                    if entry.name.endswith(".sop.md")
+                    and not (skip_names and entry.name.removesuffix(".sop.md") in skip_names)
+                    and entry.is_file()
+                ]
+
+            # Read files concurrently; executor.map preserves directory order
+            with ThreadPoolExecutor(max_workers=LOCAL_MAX_WORKERS) as executor:
+                return list(filter(None, executor.map(self._load_single_sop, sop_files)))
         except Exception as e:
             logger.error(f"Error scanning directory {self.directory_path}: {e}")
             return []
@@ -54,24 +246,14 @@ class LocalDirectorySource(SOPSource):
     def _load_single_sop(self, sop_file: Path) -> Optional[Dict[str, Any]]:
         """Load a single SOP file, returning None if invalid"""
         try:
-            sop_content = sop_file.read_text(encoding="utf-8")
-
-            # Extract overview section for description
-            overview_match = re.search(
-                r"## Overview\s*\n(.*?)(?=\n##|\n#|\Z)", sop_content, re.DOTALL
-            )
-            if not overview_match:
+            stat = sop_file.stat()
+            sop = _read_local_sop(str(sop_file), stat.st_mtime_ns, stat.st_size)
+            if sop is None:
                 logger.warning(f"No Overview section found in {sop_file}")
                 return None
 
-            description = overview_match.group(1).strip().replace("\n", " ")
-            sop_name = sop_file.stem.removesuffix(".sop")
-
-            return {
-                "name": sop_name,
-                "content": sop_content,
-                "description": description,
-            }
+            # Copy so callers never mutate the cached entry
+            return dict(sop)
         except Exception as e:
             logger.error(f"Error loading SOP from {sop_file}: {e}")
             return None
@@ -85,56 +267,87 @@ class S3Source(SOPSource):
     
     def __init__(self, bucket: str, prefix: Optional[str] = None, 
                  region: Optional[str] = None, endpoint_url: Optional[str] = None,
-                 profile: Optional[str] = None):
+                 profile: Optional[str] = None, use_aiobotocore: bool = False):
         self.bucket = bucket
         self.prefix = prefix or ""
         self.region = region
         self.endpoint_url = endpoint_url
         self.profile = profile
+        self.use_aiobotocore = use_aiobotocore
         self._s3_client = None
     
     @property
     def s3_client(self):
-        """Lazy initialization of S3 client"""
+        """Lazy initialization of S3 client, shared across sources with the same config"""
         if self._s3_client is None:
-            try:
-                import boto3
-                from botocore.exceptions import ClientError, NoCredentialsError
-            except ImportError:
-                logger.error("boto3 is required for S3 sources. Install with: pip install boto3")
-                raise ImportError("boto3 is required for S3 sources")
-            
-            # Build session configuration
-            session_kwargs = {}
-            if self.profile:
-                session_kwargs['profile_name'] = self.profile
-            
-            session = boto3.Session(**session_kwargs)
-            
-            # Build client configuration
-            client_kwargs = {}
-            if self.region:
-                client_kwargs['region_name'] = self.region
-            if self.endpoint_url:
-                client_kwargs['endpoint_url'] = self.endpoint_url
-            
-            self._s3_client = session.client('s3', **client_kwargs)
-        
+            key = (self.region, self.endpoint_url, self.profile)
+            with _CLIENT_CACHE_LOCK:
+                client = _CLIENT_CACHE.get(key)
+                if client is None:
+                    client = _CLIENT_CACHE[key] = self._create_s3_client()
+            self._s3_client = client
+
         return self._s3_client
-    
-    def load_sops(self) -> List[Dict[str, Any]]:
+
+    def _create_s3_client(self):
+        """Create a new boto3 S3 client for this source's configuration"""
+        boto3 = _import_boto3()
+        from botocore.config import Config
+
+        # Build session configuration
+        session_kwargs = {}
+        if self.profile:
+            session_kwargs['profile_name'] = self.profile
+
+        session = boto3.Session(**session_kwargs)
+
+        # The connection pool must fit the concurrent fetches
+        return session.client('s3', **self._client_kwargs(Config(
+            max_pool_connections=2 * S3_MAX_WORKERS,
+            retries={'max_attempts': 3, 'mode': 'standard'},
+        )))
+
+    def _client_kwargs(self, config: Any) -> Dict[str, Any]:
+        """Build S3 client keyword arguments for this source's configuration"""
+        client_kwargs = {'config': config}
+        if self.region:
+            client_kwargs['region_name'] = self.region
+        if self.endpoint_url:
+            client_kwargs['endpoint_url'] = self.endpoint_url
+        return client_kwargs
+
+    def load_sops(self, skip_names: Optional[Set[str]] = None) -> List[Dict[str, Any]]:
         """Load SOPs from S3 bucket"""
         try:
-            import boto3
-            from botocore.exceptions import ClientError, NoCredentialsError
+            _import_boto3()
         except ImportError:
-            logger.error("boto3 is required for S3 sources. Install with: pip install boto3")
             return []
 
+        from botocore.exceptions import ClientError, NoCredentialsError
+
         try:
-            s3_objects = self._list_s3_objects()
-            sop_keys = filter(lambda key: key.endswith('.sop.md'), s3_objects)
-            return list(filter(None, map(self._load_s3_sop, sop_keys)))
+            sop_objects = self._iter_sop_objects()
+            if skip_names:
+                sop_objects = (
+                    (key, etag) for key, etag in sop_objects
+                    if Path(key).name.removesuffix(".sop.md") not in skip_names
+                )
+
+            if self.use_aiobotocore:
+                sop_objects = list(sop_objects)
+                try:
+                    return self._load_all_aiobotocore([key for key, _ in sop_objects])
+                except ImportError:
+                    logger.warning(
+                        "aiobotocore is not installed, falling back to boto3. "
+                        "Install with: pip install aiobotocore"
+                    )
+
+            # Fetch objects concurrently; executor.map preserves key order
+            with ThreadPoolExecutor(max_workers=S3_MAX_WORKERS) as executor:
+                return list(filter(None, executor.map(
+                    lambda obj: self._load_s3_sop(*obj), sop_objects
+                )))
         except ClientError as e:
             logger.error(f"AWS S3 error loading from {self.get_source_info()}: {e}")
         except NoCredentialsError:
@@ -144,48 +357,76 @@ class S3Source(SOPSource):
 
         return []
 
-    def _list_s3_objects(self) -> List[str]:
-        """List all object keys in S3 bucket with prefix"""
+    def _iter_sop_objects(self) -> Iterator[Tuple[str, Optional[str]]]:
+        """Yield (key, ETag) of .sop.md objects in S3 bucket with prefix"""
         list_kwargs = {'Bucket': self.bucket}
         if self.prefix:
             list_kwargs['Prefix'] = self.prefix
 
         paginator = self.s3_client.get_paginator('list_objects_v2')
-        pages = paginator.paginate(**list_kwargs)
 
-        return [
-            obj['Key']
-            for page in pages
-            for obj in page.get('Contents', [])
-        ]
+        for page in _prefetch(paginator.paginate(**list_kwargs)):
+            for obj in page.get('Contents', ()):
+                key = obj['Key']
+                if key.endswith('.sop.md'):
+                    yield key, obj.get('ETag')
 
-    def _load_s3_sop(self, key: str) -> Optional[Dict[str, Any]]:
-        """Load a single SOP from S3, returning None if invalid"""
-        try:
-            response = self.s3_client.get_object(Bucket=self.bucket, Key=key)
-            sop_content = response['Body'].read().decode('utf-8')
+    def _load_s3_sop(self, key: str, etag: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Load a single SOP from S3, returning None if invalid
 
-            # Extract overview section for description
-            overview_match = re.search(
-                r"## Overview\s*\n(.*?)(?=\n##|\n#|\Z)", sop_content, re.DOTALL
-            )
-            if not overview_match:
+        Objects listed with an ETag are served from the content cache when
+        unchanged since they were last downloaded.
+        """
+        try:
+            if etag:
+                sop = _fetch_s3_sop_cached(self.s3_client, self.bucket, key, etag)
+            else:
+                sop = _fetch_s3_sop(self.s3_client, self.bucket, key)
+            if sop is None:
                 logger.warning(f"No Overview section found in S3 object {key}")
                 return None
 
-            description = overview_match.group(1).strip().replace("\n", " ")
-            filename = Path(key).name
-            sop_name = filename.removesuffix(".sop.md")
-
-            return {
-                "name": sop_name,
-                "content": sop_content,
-                "description": description,
-            }
+            # Copy so callers never mutate the cached entry
+            return dict(sop)
         except Exception as e:
             logger.error(f"Error loading SOP from S3 object {key}: {e}")
             return None
     
+    def _load_all_aiobotocore(self, keys: List[str]) -> List[Dict[str, Any]]:
+        """Load SOPs for keys with a single aiobotocore client
+
+        Raises:
+            ImportError: If aiobotocore is not installed
+        """
+        from aiobotocore.config import AioConfig
+        from aiobotocore.session import AioSession
+
+        async def load_all() -> List[Optional[Dict[str, Any]]]:
+            session = AioSession(profile=self.profile)
+            config = AioConfig(
+                max_pool_connections=2 * S3_MAX_WORKERS,
+                retries={'max_attempts': 3, 'mode': 'standard'},
+            )
+            async with session.create_client('s3', **self._client_kwargs(config)) as client:
+
+                async def load(key: str) -> Optional[Dict[str, Any]]:
+                    try:
+                        response = await client.get_object(Bucket=self.bucket, Key=key)
+                        async with response['Body'] as body:
+                            sop_content = (await body.read()).decode('utf-8')
+
+                        sop = _parse_sop(Path(key).name.removesuffix(".sop.md"), sop_content)
+                        if sop is None:
+                            logger.warning(f"No Overview section found in S3 object {key}")
+                        return sop
+                    except Exception as e:
+                        logger.error(f"Error loading SOP from S3 object {key}: {e}")
+                        return None
+
+                return await asyncio.gather(*map(load, keys))
+
+        return list(filter(None, _run_sync(load_all())))
+
     def get_source_info(self) -> str:
         return f"s3://{self.bucket}/{self.prefix}"
 
@@ -203,12 +444,11 @@ def parse_sop_source(source_string: str) -> SOPSource:
         ValueError: If source string is malformed or missing required parameters
     """
     # Parse key=value pairs
-    params = {}
-    for part in source_string.split(','):
-        if '=' not in part:
-            raise ValueError(f"Invalid source parameter format: {part}")
-        key, value = part.split('=', 1)
-        params[key.strip()] = value.strip()
+    try:
+        pairs = dict(part.split('=', 1) for part in source_string.split(','))
+    except ValueError:
+        raise ValueError(f"Invalid source parameter format in: {source_string}") from None
+    params = {key.strip(): value.strip() for key, value in pairs.items()}
     
     source_type = params.get('type')
     if not source_type:
@@ -224,7 +464,8 @@ def parse_sop_source(source_string: str) -> SOPSource:
             prefix=params.get('prefix'),
             region=params.get('region'),
             endpoint_url=params.get('endpoint-url'),
-            profile=params.get('profile')
+            profile=params.get('profile'),
+            use_aiobotocore=params.get('aiobotocore', '').lower() == 'true'
         )
     else:
         raise ValueError(f"Unsupported source type: {source_type}")
@@ -247,7 +488,7 @@ def expand_sop_paths(sop_paths_str: str) -> List[LocalDirectorySource]:
         path_str = path_str.strip()
         if not path_str:
             return None
-        return LocalDirectorySource(Path(path_str).expanduser().resolve())
+        return LocalDirectorySource(Path(path_str).expanduser().absolute())
 
     return list(filter(None, map(create_source, sop_paths_str.split(":"))))
 
@@ -292,14 +533,17 @@ def build_sop_sources(
     return sources
 
 
-def load_sops_from_sources(sources: List[SOPSource]) -> List[Dict[str, Any]]:
+def load_sops_from_sources(sources: List[SOPSource]) -> Iterator[Dict[str, Any]]:
     """Load SOPs from multiple sources with first-wins precedence
 
+    Sources are loaded lazily, so SOPs from earlier sources are yielded before
+    later sources are read.
+
     Args:
         sources: List of SOPSource instances in precedence order
 
-    Returns:
-        List of unique SOPs (first occurrence wins by name)
+    Yields:
+        Unique SOPs (first occurrence wins by name)
     """
     seen_names = set()
 
@@ -307,7 +551,7 @@ def load_sops_from_sources(sources: List[SOPSource]) -> List[Dict[str, Any]]:
         """Load SOPs from a single source, filtering duplicates"""
         logger.info(f"Loading SOPs from source: {source.get_source_info()}")
         try:
-            source_sops = source.load_sops()
+            source_sops = source.load_sops(skip_names=seen_names)
             new_sops = []
 
             for sop in source_sops:
@@ -323,4 +567,5 @@ def load_sops_from_sources(sources: List[SOPSource]) -> List[Dict[str, Any]]:
             logger.error(f"Failed to load SOPs from source {source.get_source_info()}: {e}")
             return []
 
-    return [sop for source in sources for sop in load_from_source(source)]
\ No newline at end of file
+    for source in sources:
+        yield from load_from_source(source)
\ No newline at end of file
@@ -1,8 +1,9 @@
 import logging
-import re
 from pathlib import Path
 from typing import Any
 
+from .sources import _extract_overview
+
 logger = logging.getLogger(__name__)
 
 
@@ -60,14 +61,11 @@ def load_external_sops(sop_directories: list[Path]) -> list[dict[str, Any]]:
                     sop_content = sop_file.read_text(encoding="utf-8")
 
                     # Extract overview section for description
-                    overview_match = re.search(
-                        r"## Overview\s*\n(.*?)(?=\n##|\n#|\Z)", sop_content, re.DOTALL
-                    )
-                    if not overview_match:
+                    description = _extract_overview(sop_content)
+                    if description is None:
                         logger.warning(f"No Overview section found in {sop_file}")
                         continue
 
-                    description = overview_match.group(1).strip().replace("\n", " ")
                     sop_name = sop_file.stem.removesuffix(".sop")
 
                     external_sops.append(
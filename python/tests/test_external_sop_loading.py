@@ -230,3 +230,36 @@ This is the second version that should be ignored.
         assert (
             mock_mcp_instance.prompt.call_count >= 4
         )  # Built-in SOPs (code-assist, etc.)
+
+    @patch("strands_agents_sops.mcp.FastMCP")
+    def test_registered_prompt_renders_sop_with_user_input(self, mock_fastmcp):
+        """Test that the registered prompt handler wraps SOP content and user input"""
+        mock_mcp_instance = MagicMock()
+        mock_fastmcp.return_value = mock_mcp_instance
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            sop_content = """# Render Test
+
+## Overview
+SOP used to check prompt rendering.
+"""
+            (Path(temp_dir) / "render-test.sop.md").write_text(sop_content)
+
+            run_mcp_server(sop_paths=f"{temp_dir}")
+
+            prompt_names = [
+                call[1]["name"] for call in mock_mcp_instance.prompt.call_args_list
+            ]
+            decorator_calls = mock_mcp_instance.prompt.return_value.call_args_list
+            handler = decorator_calls[prompt_names.index("render-test")][0][0]
+
+            assert handler(user_input="do it") == f"""Run this SOP:
+<agent-sop name="render-test">
+<content>
+{sop_content}
+</content>
+<user-input>
+do it
+</user-input>
+</agent-sop>"""
+            assert handler().endswith("<user-input>\n\n</user-input>\n</agent-sop>")
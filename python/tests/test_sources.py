@@ -1,11 +1,14 @@
+import asyncio
 import pytest
 from pathlib import Path
-from unittest.mock import Mock
+from types import ModuleType
+from unittest.mock import Mock, patch
 from typing import Dict, Any
 
 from strands_agents_sops.sources import (
     LocalDirectorySource,
     S3Source,
+    _extract_overview,
     parse_sop_source,
     expand_sop_paths,
     load_sops_from_sources,
@@ -60,6 +63,59 @@ def create_s3_source_with_mock_client(bucket: str, prefix: str = "") -> tuple[S3
     return source, mock_client
 
 
+def fake_aiobotocore_modules(objects: dict) -> dict:
+    """Build fake aiobotocore modules serving objects from memory
+
+    Args:
+        objects: Mapping of S3 key to body bytes, or to an exception that
+            get_object should raise for that key
+
+    Returns:
+        Module mapping suitable for patch.dict("sys.modules", ...)
+    """
+    class FakeBody:
+        def __init__(self, data: bytes):
+            self.data = data
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc_info):
+            return False
+
+        async def read(self) -> bytes:
+            return self.data
+
+    class FakeClient:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc_info):
+            return False
+
+        async def get_object(self, **kwargs):
+            key = kwargs["Key"]
+            # Finish later keys first so results must be reordered
+            await asyncio.sleep(0.001 * (len(objects) - list(objects).index(key)))
+            result = objects[key]
+            if isinstance(result, Exception):
+                raise result
+            return {'Body': FakeBody(result)}
+
+    class FakeAioSession:
+        def __init__(self, profile=None):
+            self.profile = profile
+
+        def create_client(self, service_name, **kwargs):
+            return FakeClient()
+
+    session_module = ModuleType("aiobotocore.session")
+    session_module.AioSession = FakeAioSession
+    config_module = ModuleType("aiobotocore.config")
+    config_module.AioConfig = lambda **kwargs: kwargs
+    return {"aiobotocore.session": session_module, "aiobotocore.config": config_module}
+
+
 # Tests
 
 class TestLocalDirectorySource:
@@ -79,6 +135,28 @@ class TestLocalDirectorySource:
         assert sops[0]["content"] == sop_content
         assert sops[0]["description"] == "This is a test SOP for validation."
 
+    def test_normalizes_crlf_line_endings(self, tmp_path):
+        """Test that SOPs saved with CRLF line endings load the same as LF ones"""
+        sop_content = create_test_sop("Test SOP", "Line one\nline two")
+        (tmp_path / "crlf.sop.md").write_bytes(sop_content.replace("\n", "\r\n").encode("utf-8"))
+
+        source = LocalDirectorySource(tmp_path)
+        sops = source.load_sops()
+
+        assert sops[0]["content"] == sop_content
+        assert sops[0]["description"] == "Line one line two"
+
+    def test_normalizes_cr_line_endings(self, tmp_path):
+        """Test that SOPs saved with CR-only line endings load the same as LF ones"""
+        sop_content = create_test_sop("Test SOP", "Line one\nline two")
+        (tmp_path / "cr.sop.md").write_bytes(sop_content.replace("\n", "\r").encode("utf-8"))
+
+        source = LocalDirectorySource(tmp_path)
+        sops = source.load_sops()
+
+        assert sops[0]["content"] == sop_content
+        assert sops[0]["description"] == "Line one line two"
+
     def test_skips_sops_without_overview_section(self, tmp_path):
         """Test that SOPs without Overview section are skipped with warning"""
         invalid_sop = """# Test SOP
@@ -107,6 +185,49 @@ Test step content.
         assert len(sops) == 1
         assert sops[0]["name"] == "valid"
 
+    def test_follows_symlinks_and_skips_directories(self, tmp_path):
+        """Test that symlinked SOP files load while directories named *.sop.md are skipped"""
+        target_dir = tmp_path / "target"
+        target_dir.mkdir()
+        target = target_dir / "shared.sop.md"
+        target.write_text(create_test_sop("Shared", "Linked SOP"))
+
+        sop_dir = tmp_path / "sops"
+        sop_dir.mkdir()
+        (sop_dir / "linked.sop.md").symlink_to(target)
+        (sop_dir / "folder.sop.md").mkdir()
+
+        source = LocalDirectorySource(sop_dir)
+        sops = source.load_sops()
+
+        assert [sop["name"] for sop in sops] == ["linked"]
+
+    def test_loads_many_sops_concurrently(self, tmp_path):
+        """Test that every SOP is loaded when files are read by a thread pool"""
+        for i in range(50):
+            (tmp_path / f"sop{i}.sop.md").write_text(create_test_sop(f"SOP {i}", f"SOP number {i}"))
+
+        source = LocalDirectorySource(tmp_path)
+        sops = source.load_sops()
+
+        assert {sop["name"] for sop in sops} == {f"sop{i}" for i in range(50)}
+        assert all(sop["description"] == f"SOP number {sop['name'][3:]}" for sop in sops)
+
+    def test_reuses_parsed_sops_until_file_changes(self, tmp_path):
+        """Test that unchanged files are served from cache and edits are picked up"""
+        sop_file = tmp_path / "cached.sop.md"
+        sop_file.write_text(create_test_sop("Cached", "Original"))
+        source = LocalDirectorySource(tmp_path)
+
+        with patch.object(Path, "read_bytes", autospec=True, side_effect=Path.read_bytes) as read_bytes:
+            assert source.load_sops()[0]["description"] == "Original"
+            assert source.load_sops()[0]["description"] == "Original"
+            assert read_bytes.call_count == 1
+
+            sop_file.write_text(create_test_sop("Cached", "Edited and longer"))
+            assert source.load_sops()[0]["description"] == "Edited and longer"
+            assert read_bytes.call_count == 2
+
     def test_handles_nonexistent_directory_gracefully(self, tmp_path):
         """Test that nonexistent directories return empty list without error"""
         nonexistent = tmp_path / "nonexistent"
@@ -152,6 +273,28 @@ class TestS3Source:
         mock_client.get_paginator.assert_called_once_with('list_objects_v2')
         assert mock_client.get_object.call_count == 2
 
+    def test_concurrent_fetch_preserves_order_and_skips_failures(self):
+        """Test that concurrently fetched SOPs keep listing order and failed objects are skipped"""
+        source, mock_client = create_s3_source_with_mock_client("test-bucket")
+
+        sop_keys = [f"sop{i}.sop.md" for i in range(20)]
+        setup_s3_mock_client(mock_client, sop_keys, "")
+
+        def get_object(**kwargs):
+            key = kwargs["Key"]
+            if key == "sop5.sop.md":
+                raise Exception("Simulated object failure")
+            body = Mock()
+            body.read.return_value = create_test_sop(key, f"Description of {key}").encode('utf-8')
+            return {'Body': body}
+
+        mock_client.get_object.side_effect = get_object
+
+        sops = source.load_sops()
+
+        expected = [f"sop{i}" for i in range(20) if i != 5]
+        assert [sop["name"] for sop in sops] == expected
+
     def test_loads_from_bucket_root_when_no_prefix(self):
         """Test that S3 source works without prefix parameter"""
         source, mock_client = create_s3_source_with_mock_client("test-bucket")
@@ -180,6 +323,158 @@ class TestS3Source:
         sops = source.load_sops()
         assert sops == []
 
+    def test_loads_sops_across_multiple_pages(self):
+        """Test that keys from every listing page are loaded in order"""
+        source, mock_client = create_s3_source_with_mock_client("test-bucket")
+        setup_s3_mock_client(mock_client, [], create_test_sop("Test SOP", "Paged SOP"))
+        mock_client.get_paginator.return_value.paginate.return_value = [
+            {'Contents': [{'Key': 'a.sop.md'}, {'Key': 'b.sop.md'}]},
+            {},
+            {'Contents': [{'Key': 'c.sop.md'}, {'Key': 'notes.txt'}]},
+        ]
+
+        sops = source.load_sops()
+
+        assert [sop["name"] for sop in sops] == ["a", "b", "c"]
+
+    def test_handles_errors_raised_while_paginating(self):
+        """Test that an error on a later listing page is handled gracefully"""
+        from botocore.exceptions import ClientError
+
+        source, mock_client = create_s3_source_with_mock_client("test-bucket")
+        setup_s3_mock_client(mock_client, [], create_test_sop("Test SOP", "Paged SOP"))
+
+        def pages():
+            yield {'Contents': [{'Key': 'a.sop.md'}]}
+            raise ClientError(
+                error_response={'Error': {'Code': 'AccessDenied', 'Message': 'Access Denied'}},
+                operation_name='ListObjectsV2'
+            )
+
+        mock_client.get_paginator.return_value.paginate.return_value = pages()
+
+        sops = source.load_sops()
+        assert sops == []
+
+    def test_reuses_downloaded_sops_while_etag_is_unchanged(self):
+        """Test that objects are only downloaded again when their ETag changes"""
+        source, mock_client = create_s3_source_with_mock_client("etag-bucket")
+        setup_s3_mock_client(mock_client, [], create_test_sop("Test SOP", "ETag SOP"))
+        paginate = mock_client.get_paginator.return_value.paginate
+
+        paginate.return_value = [{'Contents': [{'Key': 'etag.sop.md', 'ETag': '"v1"'}]}]
+        assert [sop["name"] for sop in source.load_sops()] == ["etag"]
+        assert [sop["name"] for sop in source.load_sops()] == ["etag"]
+        assert mock_client.get_object.call_count == 1
+
+        paginate.return_value = [{'Contents': [{'Key': 'etag.sop.md', 'ETag': '"v2"'}]}]
+        source.load_sops()
+        assert mock_client.get_object.call_count == 2
+
+    def test_falls_back_to_boto3_when_aiobotocore_is_missing(self):
+        """Test that the aiobotocore option still loads SOPs when aiobotocore is unavailable"""
+        source, mock_client = create_s3_source_with_mock_client("test-bucket")
+        source.use_aiobotocore = True
+        setup_s3_mock_client(mock_client, ['a.sop.md', 'b.sop.md'], create_test_sop("Test SOP", "Fallback SOP"))
+
+        with patch.dict("sys.modules", {"aiobotocore.config": None, "aiobotocore.session": None}):
+            sops = source.load_sops()
+
+        assert [sop["name"] for sop in sops] == ["a", "b"]
+        assert mock_client.get_object.call_count == 2
+
+    def test_aiobotocore_loads_sops_in_key_order(self):
+        """Test that SOPs downloaded with aiobotocore keep listing order"""
+        source, mock_client = create_s3_source_with_mock_client("test-bucket")
+        source.use_aiobotocore = True
+        keys = [f"sop{i}.sop.md" for i in range(10)]
+        setup_s3_mock_client(mock_client, keys, "")
+        objects = {key: create_test_sop(key, f"Async {key}").encode('utf-8') for key in keys}
+
+        with patch.dict("sys.modules", fake_aiobotocore_modules(objects)):
+            sops = source.load_sops()
+
+        assert [sop["name"] for sop in sops] == [f"sop{i}" for i in range(10)]
+        assert sops[3]["description"] == "Async sop3.sop.md"
+        mock_client.get_object.assert_not_called()
+
+    def test_aiobotocore_skips_sops_without_overview(self, caplog):
+        """Test that aiobotocore downloads without an Overview are dropped with a warning"""
+        source, mock_client = create_s3_source_with_mock_client("test-bucket")
+        source.use_aiobotocore = True
+        setup_s3_mock_client(mock_client, ['valid.sop.md', 'invalid.sop.md'], "")
+        objects = {
+            'valid.sop.md': create_test_sop("Valid", "Valid SOP").encode('utf-8'),
+            'invalid.sop.md': b"# Invalid\n\n## Steps\nNo overview",
+        }
+
+        with patch.dict("sys.modules", fake_aiobotocore_modules(objects)):
+            sops = source.load_sops()
+
+        assert [sop["name"] for sop in sops] == ["valid"]
+        assert "No Overview section found in S3 object invalid.sop.md" in caplog.text
+
+    def test_aiobotocore_skips_objects_that_fail_to_download(self):
+        """Test that a failed aiobotocore download does not stop other SOPs loading"""
+        source, mock_client = create_s3_source_with_mock_client("test-bucket")
+        source.use_aiobotocore = True
+        setup_s3_mock_client(mock_client, ['a.sop.md', 'broken.sop.md', 'b.sop.md'], "")
+        objects = {
+            'a.sop.md': create_test_sop("A", "First").encode('utf-8'),
+            'broken.sop.md': Exception("Simulated object failure"),
+            'b.sop.md': create_test_sop("B", "Second").encode('utf-8'),
+        }
+
+        with patch.dict("sys.modules", fake_aiobotocore_modules(objects)):
+            sops = source.load_sops()
+
+        assert [sop["name"] for sop in sops] == ["a", "b"]
+
+    def test_aiobotocore_loads_from_inside_running_event_loop(self):
+        """Test that load_sops works with aiobotocore when an event loop is already running"""
+        source, mock_client = create_s3_source_with_mock_client("test-bucket")
+        source.use_aiobotocore = True
+        setup_s3_mock_client(mock_client, ['a.sop.md', 'b.sop.md'], "")
+        objects = {
+            'a.sop.md': create_test_sop("A", "First").encode('utf-8'),
+            'b.sop.md': create_test_sop("B", "Second").encode('utf-8'),
+        }
+
+        async def load_in_loop():
+            return source.load_sops()
+
+        with patch.dict("sys.modules", fake_aiobotocore_modules(objects)):
+            sops = asyncio.run(load_in_loop())
+
+        assert [sop["name"] for sop in sops] == ["a", "b"]
+
+    def test_boto3_is_not_imported_until_an_s3_source_loads(self):
+        """Test that importing the sources module does not import boto3"""
+        import subprocess
+        import sys
+
+        result = subprocess.run(
+            [sys.executable, "-c",
+             "import sys, strands_agents_sops.sources; assert 'boto3' not in sys.modules"],
+            capture_output=True,
+            text=True,
+        )
+        assert result.returncode == 0, result.stderr
+
+    def test_reuses_s3_client_for_sources_with_same_config(self):
+        """Test that sources with identical configuration share one S3 client"""
+        with patch.dict("strands_agents_sops.sources._CLIENT_CACHE", clear=True), \
+                patch("boto3.Session") as mock_session:
+            mock_session.return_value.client.side_effect = lambda *args, **kwargs: Mock()
+
+            first = S3Source(bucket="bucket-a", region="us-west-2")
+            second = S3Source(bucket="bucket-b", region="us-west-2")
+            other = S3Source(bucket="bucket-a", region="eu-west-1")
+
+            assert first.s3_client is second.s3_client
+            assert other.s3_client is not first.s3_client
+            assert mock_session.return_value.client.call_count == 2
+
     def test_handles_missing_aws_credentials_gracefully(self):
         """Test graceful handling when AWS credentials are not available"""
         from botocore.exceptions import NoCredentialsError
@@ -191,6 +486,31 @@ class TestS3Source:
         assert sops == []
 
 
+class TestExtractOverview:
+    """Tests for _extract_overview - must match the original Overview regex"""
+
+    @pytest.mark.parametrize("content", [
+        create_test_sop("Test", "Simple description."),
+        "# T\n\n## Overview\nLine one\nline two\n\n## Steps\nStep",
+        "# T\n\n## Overview\n\n\n  Indented\n# Top level",
+        "# T\n\n## Overview\nRuns to end of file",
+        "# T\n\n## Overview\n## Steps\nStep\n# Next",
+        "# T\n\n## Overview   \t\nTrailing whitespace on heading\n## Steps",
+        "# T\n\n## Overview of things\nNot a heading\n## Overview\nReal one",
+        "# T\n\n## Overview",
+        "# T\n\n## Overview\n",
+        "# T\n\n## Steps\nNo overview here",
+    ])
+    def test_matches_overview_regex(self, content):
+        """Test that the str.find implementation agrees with the regex it replaced"""
+        import re
+
+        match = re.search(r"## Overview\s*\n(.*?)(?=\n##|\n#|\Z)", content, re.DOTALL)
+        expected = match.group(1).strip().replace("\n", " ") if match else None
+
+        assert _extract_overview(content) == expected
+
+
 class TestParseSopSource:
     """Tests for parse_sop_source - configuration parsing"""
 
@@ -214,6 +534,14 @@ class TestParseSopSource:
         assert source.region == "us-west-2"
         assert source.endpoint_url == "https://s3.example.com"
         assert source.profile == "myprofile"
+        assert source.use_aiobotocore is False
+
+    def test_parses_aiobotocore_option(self):
+        """Test that the aiobotocore option enables the async S3 client"""
+        source = parse_sop_source("type=s3,bucket=my-bucket,aiobotocore=true")
+
+        assert isinstance(source, S3Source)
+        assert source.use_aiobotocore is True
 
     def test_rejects_configuration_without_type(self):
         """Test that configuration without type parameter is rejected"""
@@ -260,6 +588,17 @@ class TestExpandSopPaths:
         assert str(sources[0].directory_path).startswith(str(Path.home()))
         assert str(sources[0].directory_path).endswith("test")
 
+    def test_makes_relative_paths_absolute_without_resolving(self, tmp_path, monkeypatch):
+        """Test that relative paths become absolute without following symlinks"""
+        (tmp_path / "real").mkdir()
+        (tmp_path / "link").symlink_to(tmp_path / "real")
+        monkeypatch.chdir(tmp_path)
+
+        sources = expand_sop_paths("link")
+
+        assert sources[0].directory_path.is_absolute()
+        assert sources[0].directory_path.name == "link"
+
     def test_returns_empty_list_for_empty_string(self):
         """Test that empty string returns empty list"""
         sources = expand_sop_paths("")
@@ -289,7 +628,7 @@ class TestLoadSopsFromSources:
             LocalDirectorySource(dir2)
         ]
 
-        sops = load_sops_from_sources(sources)
+        sops = list(load_sops_from_sources(sources))
 
         # Should have 3 SOPs: duplicate (from dir1), unique1, unique2
         assert len(sops) == 3
@@ -317,13 +656,50 @@ class TestLoadSopsFromSources:
             failing_source
         ]
 
-        sops = load_sops_from_sources(sources)
+        sops = list(load_sops_from_sources(sources))
 
         # Should still get SOP from valid source
         assert len(sops) == 1
         assert sops[0]["name"] == "test"
 
+    def test_later_sources_do_not_fetch_shadowed_sops(self, tmp_path):
+        """Test that SOPs already claimed by an earlier source are never fetched from S3"""
+        (tmp_path / "shared.sop.md").write_text(create_test_sop("Shared", "From local"))
+
+        s3_source, mock_client = create_s3_source_with_mock_client("test-bucket", "sops/")
+        setup_s3_mock_client(
+            mock_client,
+            ['sops/shared.sop.md', 'sops/remote.sop.md'],
+            create_test_sop("Remote", "From S3"),
+        )
+
+        sops = list(load_sops_from_sources([LocalDirectorySource(tmp_path), s3_source]))
+
+        assert [(sop["name"], sop["description"]) for sop in sops] == [
+            ("shared", "From local"),
+            ("remote", "From S3"),
+        ]
+        mock_client.get_object.assert_called_once_with(
+            Bucket="test-bucket", Key="sops/remote.sop.md"
+        )
+
+    def test_loads_later_sources_lazily(self, tmp_path):
+        """Test that later sources are not loaded until earlier SOPs are consumed"""
+        (tmp_path / "first.sop.md").write_text(create_test_sop("First", "From first source"))
+
+        later_source = Mock()
+        later_source.get_source_info.return_value = "mock:later-source"
+        later_source.load_sops.return_value = []
+
+        sops = load_sops_from_sources([LocalDirectorySource(tmp_path), later_source])
+
+        assert next(sops)["name"] == "first"
+        later_source.load_sops.assert_not_called()
+
+        assert list(sops) == []
+        later_source.load_sops.assert_called_once()
+
     def test_returns_empty_list_for_no_sources(self):
         """Test that empty sources list returns empty SOP list"""
-        sops = load_sops_from_sources([])
+        sops = list(load_sops_from_sources([]))
         assert sops == []